@@ -11,15 +11,9 @@ from typing import Any
 
 import click
 
-from navi_bootstrap.diff import compute_diffs
-from navi_bootstrap.engine import plan, render, render_to_files
-from navi_bootstrap.hooks import run_hooks
-from navi_bootstrap.init import inspect_project
-from navi_bootstrap.manifest import ManifestError, load_manifest
-from navi_bootstrap.resolve import ResolveError, resolve_action_shas
-from navi_bootstrap.sanitize import sanitize_manifest, sanitize_spec
-from navi_bootstrap.spec import SpecError, load_spec
-from navi_bootstrap.validate import run_validations
+# Pipeline modules are imported inside each command body so that
+# `nboot --help`, `nboot --version` and `nboot validate` don't pay for
+# importing Jinja2, the diff engine, or the project inspectors.
 
 
 @click.group()
@@ -28,11 +22,36 @@ def cli() -> None:
     """nboot — bootstrap projects to navi-os-grade posture."""
 
 
+def _load_inputs(spec: Path, pack: Path) -> tuple[dict[str, Any], dict[str, Any]]:
+    """Load, validate and sanitize the spec and pack manifest for a command.
+
+    Returns (spec_data, manifest). Load errors become ClickExceptions.
+    """
+    from navi_bootstrap.manifest import ManifestError, load_manifest
+    from navi_bootstrap.sanitize import sanitize_manifest, sanitize_spec
+    from navi_bootstrap.spec import SpecError, load_spec
+
+    try:
+        spec_data = load_spec(spec)
+    except SpecError as e:
+        raise click.ClickException(str(e)) from e
+
+    try:
+        manifest = load_manifest(pack / "manifest.yaml")
+    except ManifestError as e:
+        raise click.ClickException(str(e)) from e
+
+    return sanitize_spec(spec_data), sanitize_manifest(manifest)
+
+
 @cli.command()
 @click.option("--spec", required=True, type=click.Path(exists=True, path_type=Path))
 @click.option("--pack", type=click.Path(exists=True, path_type=Path), default=None)
 def validate(spec: Path, pack: Path | None) -> None:
     """Validate a spec (and optionally a pack manifest)."""
+    from navi_bootstrap.manifest import ManifestError, load_manifest
+    from navi_bootstrap.spec import SpecError, load_spec
+
     try:
         load_spec(spec)
         click.echo(f"Spec valid: {spec}")
@@ -58,17 +77,11 @@ def render_cmd(
     spec: Path, pack: Path, out: Path | None, dry_run: bool, skip_resolve: bool, trust: bool
 ) -> None:
     """Render a template pack into a new project (greenfield)."""
-    try:
-        spec_data = load_spec(spec)
-    except SpecError as e:
-        raise click.ClickException(str(e)) from e
-    spec_data = sanitize_spec(spec_data)
+    from navi_bootstrap.engine import plan, render
+    from navi_bootstrap.hooks import run_hooks
+    from navi_bootstrap.resolve import ResolveError, resolve_action_shas
 
-    try:
-        manifest = load_manifest(pack / "manifest.yaml")
-    except ManifestError as e:
-        raise click.ClickException(str(e)) from e
-    manifest = sanitize_manifest(manifest)
+    spec_data, manifest = _load_inputs(spec, pack)
 
     if out is None:
         name = spec_data["name"]
@@ -93,10 +106,11 @@ def render_cmd(
     render_plan = plan(manifest, spec_data, templates_dir)
 
     if dry_run:
-        click.echo("Dry run — render plan:")
+        lines = ["Dry run — render plan:"]
         for entry in render_plan.entries:
             mode_tag = f" [{entry.mode}]" if entry.mode != "create" else ""
-            click.echo(f"  {entry.src} → {entry.dest}{mode_tag}")
+            lines.append(f"  {entry.src} → {entry.dest}{mode_tag}")
+        click.echo("\n".join(lines))
         return
 
     # Stage 3: Render
@@ -146,17 +160,12 @@ def apply(
     spec: Path, pack: Path, target: Path, dry_run: bool, skip_resolve: bool, trust: bool
 ) -> None:
     """Apply a template pack to an existing project."""
-    try:
-        spec_data = load_spec(spec)
-    except SpecError as e:
-        raise click.ClickException(str(e)) from e
-    spec_data = sanitize_spec(spec_data)
+    from navi_bootstrap.engine import plan, render
+    from navi_bootstrap.hooks import run_hooks
+    from navi_bootstrap.resolve import ResolveError, resolve_action_shas
+    from navi_bootstrap.validate import run_validations
 
-    try:
-        manifest = load_manifest(pack / "manifest.yaml")
-    except ManifestError as e:
-        raise click.ClickException(str(e)) from e
-    manifest = sanitize_manifest(manifest)
+    spec_data, manifest = _load_inputs(spec, pack)
 
     # Stage 0: Resolve SHAs
     action_shas_config = manifest.get("action_shas", [])
@@ -170,10 +179,11 @@ def apply(
     render_plan = plan(manifest, spec_data, templates_dir)
 
     if dry_run:
-        click.echo("Dry run — render plan:")
+        lines = ["Dry run — render plan:"]
         for entry in render_plan.entries:
             mode_tag = f" [{entry.mode}]" if entry.mode != "create" else ""
-            click.echo(f"  {entry.src} → {entry.dest}{mode_tag}")
+            lines.append(f"  {entry.src} → {entry.dest}{mode_tag}")
+        click.echo("\n".join(lines))
         return
 
     # Stage 3: Render
@@ -232,17 +242,11 @@ def apply(
 @click.option("--skip-resolve", is_flag=True, default=False, help="Skip SHA resolution (offline)")
 def diff_cmd(spec: Path, pack: Path, target: Path, skip_resolve: bool) -> None:
     """Preview what a pack would change without writing anything."""
-    try:
-        spec_data = load_spec(spec)
-    except SpecError as e:
-        raise click.ClickException(str(e)) from e
-    spec_data = sanitize_spec(spec_data)
+    from navi_bootstrap.diff import compute_diffs
+    from navi_bootstrap.engine import plan, render_to_files
+    from navi_bootstrap.resolve import ResolveError, resolve_action_shas
 
-    try:
-        manifest = load_manifest(pack / "manifest.yaml")
-    except ManifestError as e:
-        raise click.ClickException(str(e)) from e
-    manifest = sanitize_manifest(manifest)
+    spec_data, manifest = _load_inputs(spec, pack)
 
     # Stage 0: Resolve SHAs
     action_shas_config = manifest.get("action_shas", [])
@@ -271,10 +275,12 @@ def diff_cmd(spec: Path, pack: Path, target: Path, skip_resolve: bool) -> None:
         click.echo("No changes — target is up to date.")
         raise SystemExit(0)
 
+    lines: list[str] = []
     for d in diffs:
         label = "(new)" if d.is_new else "(changed)"
-        click.echo(f"--- {d.dest} {label} ---")
-        click.echo(d.diff_text)
+        lines.append(f"--- {d.dest} {label} ---")
+        lines.append(d.diff_text)
+    click.echo("\n".join(lines))
 
     n = len(diffs)
     click.echo(f"\n{n} file{'s' if n != 1 else ''} would change.")
@@ -297,6 +303,9 @@ def diff_cmd(spec: Path, pack: Path, target: Path, skip_resolve: bool) -> None:
 @click.option("--yes", "-y", is_flag=True, default=False, help="Skip confirmation prompts")
 def init(target: Path, out: Path | None, yes: bool) -> None:
     """Generate a project spec by inspecting an existing project."""
+    from navi_bootstrap.init import inspect_project
+    from navi_bootstrap.sanitize import sanitize_spec
+
     click.echo(f"Inspecting {target}...\n")
 
     spec = inspect_project(target)
@@ -339,27 +348,31 @@ def init(target: Path, out: Path | None, yes: bool) -> None:
 
 def _display_spec(spec: dict[str, Any]) -> None:
     """Display a summary of the detected spec."""
-    click.echo(f"  Name:        {spec.get('name', '(unknown)')}")
-    click.echo(f"  Language:    {spec.get('language', '(unknown)')}")
+    rows: list[tuple[str, Any]] = [
+        ("Name:", spec.get("name", "(unknown)")),
+        ("Language:", spec.get("language", "(unknown)")),
+    ]
     if v := spec.get("version"):
-        click.echo(f"  Version:     {v}")
+        rows.append(("Version:", v))
     if pv := spec.get("python_version"):
-        click.echo(f"  Python:      {pv}")
+        rows.append(("Python:", pv))
     if s := spec.get("structure"):
         if src := s.get("src_dir"):
-            click.echo(f"  Source:      {src}")
+            rows.append(("Source:", src))
         if td := s.get("test_dir"):
-            click.echo(f"  Tests:       {td}")
+            rows.append(("Tests:", td))
     if gh := spec.get("github"):
-        click.echo(f"  GitHub:      {gh.get('org', '?')}/{gh.get('repo', '?')}")
+        rows.append(("GitHub:", f"{gh.get('org', '?')}/{gh.get('repo', '?')}"))
     if f := spec.get("features"):
         active = [k for k, v in f.items() if v]
         if active:
-            click.echo(f"  Features:    {', '.join(active)}")
+            rows.append(("Features:", ", ".join(active)))
     if r := spec.get("recon"):
         tools = r.get("existing_tools", {})
         found = [k for k, v in tools.items() if v]
         if found:
-            click.echo(f"  Tools:       {', '.join(found)}")
+            rows.append(("Tools:", ", ".join(found)))
         if tc := r.get("test_count"):
-            click.echo(f"  Test count:  {tc}")
+            rows.append(("Test count:", tc))
+
+    click.echo("\n".join(f"  {label:<12} {value}" for label, value in rows))
@@ -7,17 +7,11 @@ from __future__ import annotations
 
 import difflib
 import re
+from collections.abc import Iterator
 from dataclasses import dataclass
 from pathlib import Path
 
-from navi_bootstrap.engine import RenderedFile
-
-_MARKER_START = "# --- nboot: {pack_name} ---"
-_MARKER_END = "# --- end nboot: {pack_name} ---"
-_MARKER_RE = re.compile(
-    r"# --- nboot: (?P<pack>\S+) ---\n.*?# --- end nboot: (?P=pack) ---\n?",
-    re.DOTALL,
-)
+from navi_bootstrap.engine import RenderedFile, pack_markers, strip_marker_block
 
 
 @dataclass
@@ -29,24 +23,55 @@ class DiffResult:
     is_new: bool
 
 
-def _pack_marker_re(pack_name: str) -> re.Pattern[str]:
-    """Build a regex that matches only the given pack's marker block."""
-    escaped = re.escape(pack_name)
-    return re.compile(
-        rf"# --- nboot: {escaped} ---\n.*?# --- end nboot: {escaped} ---\n?",
-        re.DOTALL,
+# difflib.unified_diff's default context, kept around the trimmed middle
+_DIFF_CONTEXT = 3
+_HUNK_HEADER_RE = re.compile(r"^@@ -(\d+)(,\d+)? \+(\d+)(,\d+)? @@")
+
+
+def _unified_diff(a: list[str], b: list[str], fromfile: str, tofile: str) -> Iterator[str]:
+    """difflib.unified_diff with the common prefix and suffix trimmed first.
+
+    SequenceMatcher is quadratic in the worst case, and rendered files usually
+    differ in a small region of an otherwise identical file. Only the differing
+    middle (plus context) is handed to difflib; hunk headers are shifted back
+    to line numbers in the full files.
+    """
+    limit = min(len(a), len(b))
+    prefix = 0
+    while prefix < limit and a[prefix] == b[prefix]:
+        prefix += 1
+    suffix = 0
+    while suffix < limit - prefix and a[-1 - suffix] == b[-1 - suffix]:
+        suffix += 1
+
+    start = max(0, prefix - _DIFF_CONTEXT)
+    trim_end = max(0, suffix - _DIFF_CONTEXT)
+    lines = difflib.unified_diff(
+        a[start : len(a) - trim_end],
+        b[start : len(b) - trim_end],
+        fromfile=fromfile,
+        tofile=tofile,
     )
+    if start == 0:
+        yield from lines
+        return
+
+    def shift(m: re.Match[str]) -> str:
+        return f"@@ -{int(m[1]) + start}{m[2] or ''} +{int(m[3]) + start}{m[4] or ''} @@"
+
+    for line in lines:
+        if line.startswith("@@"):
+            line = _HUNK_HEADER_RE.sub(shift, line, count=1)
+        yield line
 
 
 def _compute_append_content(existing: str, rendered: str, pack_name: str) -> str:
     """Compute what append mode would produce, matching engine._write_append logic."""
-    marker_start = _MARKER_START.format(pack_name=pack_name)
-    marker_end = _MARKER_END.format(pack_name=pack_name)
+    marker_start, marker_end = pack_markers(pack_name)
     block = f"{marker_start}\n{rendered}{marker_end}\n"
 
     if marker_start in existing:
-        pack_re = _pack_marker_re(pack_name)
-        new_content = pack_re.sub("", existing, count=1)
+        new_content = strip_marker_block(existing, marker_start, marker_end)
         if new_content and not new_content.endswith("\n"):
             new_content += "\n"
         return new_content + block
@@ -77,12 +102,11 @@ def compute_diffs(
             # New file: diff against empty
             # For append mode, wrap in marker blocks like the engine would
             if rf.mode == "append":
-                marker_start = _MARKER_START.format(pack_name=pack_name)
-                marker_end = _MARKER_END.format(pack_name=pack_name)
+                marker_start, marker_end = pack_markers(pack_name)
                 new_content = f"{marker_start}\n{rf.content}{marker_end}\n"
             else:
                 new_content = rf.content
-            diff_lines = list(
+            diff_text = "".join(
                 difflib.unified_diff(
                     [],
                     new_content.splitlines(keepends=True),
@@ -91,18 +115,19 @@ def compute_diffs(
                 )
             )
         else:
-            existing = file_path.read_text()
+            existing = file_path.read_text(encoding="utf-8")
 
             if rf.mode == "append":
                 new_content = _compute_append_content(existing, rf.content, pack_name)
             else:
                 new_content = rf.content
 
+            # Fast path before splitting either side into lines
             if existing == new_content:
                 continue
 
-            diff_lines = list(
-                difflib.unified_diff(
+            diff_text = "".join(
+                _unified_diff(
                     existing.splitlines(keepends=True),
                     new_content.splitlines(keepends=True),
                     fromfile=f"a/{rf.dest}",
@@ -110,11 +135,11 @@ def compute_diffs(
                 )
             )
 
-        if diff_lines:
+        if diff_text:
             results.append(
                 DiffResult(
                     dest=rf.dest,
-                    diff_text="".join(diff_lines),
+                    diff_text=diff_text,
                     is_new=is_new,
                 )
             )
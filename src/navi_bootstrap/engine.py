@@ -5,7 +5,7 @@
 
 from __future__ import annotations
 
-import re
+import functools
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -47,10 +47,20 @@ class RenderedFile:
     mode: str = "create"  # "create" or "append"
 
 
-def _resolve_dotpath(obj: Any, path: str) -> Any:
-    """Resolve a dotpath like 'spec.features.ci' against a nested dict."""
+@functools.lru_cache(maxsize=256)
+def _split_dotpath(path: str) -> tuple[str, ...]:
+    """Split a dotpath once; manifests reuse the same few paths on every plan."""
+    return tuple(path.split("."))
+
+
+def _resolve_dotpath(obj: Any, path: str | tuple[str, ...]) -> Any:
+    """Resolve a dotpath like 'spec.features.ci' against a nested dict.
+
+    Accepts the dotted string or its pre-split parts.
+    """
+    parts = _split_dotpath(path) if isinstance(path, str) else path
     current = obj
-    for part in path.split("."):
+    for part in parts:
         if isinstance(current, dict):
             current = current.get(part)
         else:
@@ -58,33 +68,57 @@ def _resolve_dotpath(obj: Any, path: str) -> Any:
     return current
 
 
+def _resolve_spec_path(spec: dict[str, Any], path: str) -> Any:
+    """Resolve a 'spec.'-rooted dotpath without building a {"spec": spec} wrapper."""
+    parts = _split_dotpath(path)
+    if parts[0] != "spec":
+        return None
+    return _resolve_dotpath(spec, parts[1:])
+
+
+@functools.lru_cache(maxsize=256)
+def _parse_condition(condition_expr: str) -> tuple[bool, str]:
+    """Split a condition into (negate, dotpath)."""
+    # Count leading ! for proper negation (!! cancels out)
+    path = condition_expr.lstrip("!")
+    bang_count = len(condition_expr) - len(path)
+    return bang_count % 2 == 1, path
+
+
 def _eval_condition(condition_expr: str, spec: dict[str, Any]) -> bool:
     """Evaluate a dotpath condition expression against spec context.
 
     Supports negation with '!' prefix: "!spec.recon.existing_tools.ruff"
     evaluates to True when the dotpath is falsy.
     """
-    # Count leading ! for proper negation (!! cancels out)
-    bang_count = len(condition_expr) - len(condition_expr.lstrip("!"))
-    negate = bang_count % 2 == 1
-    path = condition_expr.lstrip("!")
-    context = {"spec": spec}
-    value = _resolve_dotpath(context, path)
-    result = bool(value)
+    negate, path = _parse_condition(condition_expr)
+    result = bool(_resolve_spec_path(spec, path))
     return not result if negate else result
 
 
+# Built once at import; environment setup is not free and dest rendering runs
+# per loop item.
+_DEST_ENV = jinja2.sandbox.SandboxedEnvironment(undefined=jinja2.StrictUndefined)
+
+
+@functools.lru_cache(maxsize=256)
+def _compile_dest(dest_template: str) -> jinja2.Template:
+    """Parse a dest template once; plan() renders the same dest per loop item."""
+    return _DEST_ENV.from_string(dest_template)
+
+
 def _render_dest_path(dest_template: str, context: dict[str, Any]) -> str:
     """Render Jinja2 expressions in destination paths.
 
     Uses SandboxedEnvironment to prevent SSTI from hostile pack manifests.
     Dest templates are pack-controlled input — sandboxing blocks dunder
     attribute access (__class__, __mro__, __subclasses__) while allowing
-    normal variable interpolation.
+    normal variable interpolation. Static dests (no Jinja2 delimiters) are
+    returned as-is without parsing.
     """
-    env = jinja2.sandbox.SandboxedEnvironment(undefined=jinja2.StrictUndefined)
-    tmpl = env.from_string(dest_template)
-    return tmpl.render(**context)
+    if "{{" not in dest_template and "{%" not in dest_template and "{#" not in dest_template:
+        return dest_template
+    return _compile_dest(dest_template).render(**context)
 
 
 _MAX_LOOP_ITEMS = 1000
@@ -115,7 +149,7 @@ def plan(
             loop_config = loops[src]
             over_path = loop_config["over"]
             as_name = loop_config["as"]
-            items = _resolve_dotpath({"spec": spec}, over_path)
+            items = _resolve_spec_path(spec, over_path)
             if items is None:
                 items = []
             if len(items) > _MAX_LOOP_ITEMS:
@@ -165,12 +199,18 @@ def render_to_files(
         "action_versions": action_versions or {},
     }
 
+    # Loops expand one src into many entries — load each template once.
+    templates = {
+        src: env.get_template(src) for src in dict.fromkeys(e.src for e in render_plan.entries)
+    }
+
     results: list[RenderedFile] = []
 
     for entry in render_plan.entries:
-        template = env.get_template(entry.src)
-        render_context = {**context, **entry.extra_context}
-        rendered = template.render(**render_context)
+        template = templates[entry.src]
+        # Template.render() builds its own dict from (mapping, **kwargs);
+        # passing both avoids materializing a merged copy here first.
+        rendered = template.render(context, **entry.extra_context)
         results.append(RenderedFile(dest=entry.dest, content=rendered, mode=entry.mode))
 
     return results
@@ -181,43 +221,60 @@ def render_to_files(
 # Marker block pattern
 _MARKER_START = "# --- nboot: {pack_name} ---"
 _MARKER_END = "# --- end nboot: {pack_name} ---"
-_MARKER_RE = re.compile(
-    r"# --- nboot: (?P<pack>\S+) ---\n.*?# --- end nboot: (?P=pack) ---\n?",
-    re.DOTALL,
-)
-
-
-def _pack_marker_re(pack_name: str) -> re.Pattern[str]:
-    """Build a regex that matches only the given pack's marker block."""
-    escaped = re.escape(pack_name)
-    return re.compile(
-        rf"# --- nboot: {escaped} ---\n.*?# --- end nboot: {escaped} ---\n?",
-        re.DOTALL,
+
+
+@functools.lru_cache(maxsize=32)
+def pack_markers(pack_name: str) -> tuple[str, str]:
+    """Build (once per pack) the (marker_start, marker_end) lines for a pack's block.
+
+    Shared with the diff engine so previews match what append mode writes.
+    """
+    return (
+        _MARKER_START.format(pack_name=pack_name),
+        _MARKER_END.format(pack_name=pack_name),
     )
 
 
+def strip_marker_block(existing: str, marker_start: str, marker_end: str) -> str:
+    """Remove the first marker block (and one trailing newline) from existing.
+
+    Blocks don't nest, so two str.find calls locate it. Only the given pack's
+    markers are matched; other packs' blocks in a shared file are untouched.
+    A start marker without a matching end leaves the text unchanged.
+    """
+    head = marker_start + "\n"
+    i = existing.find(head)
+    if i < 0:
+        return existing
+    j = existing.find(marker_end, i + len(head))
+    if j < 0:
+        return existing
+    j += len(marker_end)
+    if existing.startswith("\n", j):
+        j += 1
+    return existing[:i] + existing[j:]
+
+
 def _write_append(output_path: Path, rendered: str, pack_name: str) -> None:
     """Append rendered content with marker blocks, replacing existing markers."""
-    marker_start = _MARKER_START.format(pack_name=pack_name)
-    marker_end = _MARKER_END.format(pack_name=pack_name)
+    marker_start, marker_end = pack_markers(pack_name)
     block = f"{marker_start}\n{rendered}{marker_end}\n"
 
     if output_path.exists():
-        existing = output_path.read_text()
+        existing = output_path.read_text(encoding="utf-8")
         # Replace existing marker block if present
         if marker_start in existing:
-            pack_re = _pack_marker_re(pack_name)
-            new_content = pack_re.sub("", existing, count=1)
+            new_content = strip_marker_block(existing, marker_start, marker_end)
             if new_content and not new_content.endswith("\n"):
                 new_content += "\n"
-            output_path.write_text(new_content + block)
+            output_path.write_text(new_content + block, encoding="utf-8")
         else:
             if existing and not existing.endswith("\n"):
                 existing += "\n"
-            output_path.write_text(existing + block)
+            output_path.write_text(existing + block, encoding="utf-8")
     else:
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(block)
+        output_path.write_text(block, encoding="utf-8")
 
 
 def write_rendered(
@@ -233,16 +290,19 @@ def write_rendered(
     Returns list of written file paths.
     """
     written: list[Path] = []
+    # Resolved once: every file is checked against the same root
+    root = output_dir.resolve()
 
     seen_create_dests: set[str] = set()
+    # Packs put many files in a handful of directories; mkdir each one once.
+    made_dirs: set[Path] = set()
 
     for rf in rendered_files:
         output_path = output_dir / rf.dest
 
         # Path confinement: resolved path must stay within output_dir
         try:
-            resolved = output_path.resolve()
-            resolved.relative_to(output_dir.resolve())
+            output_path.resolve().relative_to(root)
         except ValueError:
             raise ValueError(f"Path escapes outside output directory: {rf.dest}") from None
 
@@ -257,11 +317,13 @@ def write_rendered(
         else:
             if mode == "greenfield" and output_path.exists():
                 raise FileExistsError(f"File already exists (greenfield mode): {output_path}")
-            output_path.parent.mkdir(parents=True, exist_ok=True)
+            if output_path.parent not in made_dirs:
+                output_path.parent.mkdir(parents=True, exist_ok=True)
+                made_dirs.add(output_path.parent)
             # Final symlink check after mkdir
-            if output_path.exists() and output_path.resolve() != (output_dir / rf.dest).resolve():
+            if output_path.exists() and not output_path.resolve().is_relative_to(root):
                 raise ValueError(f"Path escapes outside output directory (symlink): {rf.dest}")
-            output_path.write_text(rf.content)
+            output_path.write_text(rf.content, encoding="utf-8")
 
         written.append(output_path)
 
@@ -6,7 +6,9 @@
 from __future__ import annotations
 
 import logging
+import os
 import re
+import stat
 import subprocess
 import tomllib
 from datetime import UTC, datetime
@@ -30,14 +32,37 @@ _PYTHON_VERSION_RE = re.compile(r"3\.(\d+)")
 _DEP_NAME_RE = re.compile(r"^([a-zA-Z0-9][-a-zA-Z0-9_.]*)")
 
 _MAX_TEST_FILE_SIZE = 1_000_000  # 1 MB
+# Matched against raw bytes — counting needs no decode.
+_TEST_DEF_RE = re.compile(rb"^\s*def test_", re.MULTILINE)
+_SKIP_TEST_DIRS = frozenset({"__pycache__", ".venv", "node_modules"})
 _GITHUB_SSH_RE = re.compile(r"git@github\.com:([^/]+)/([^/.]+?)(?:\.git)?$")
 _GITHUB_HTTPS_RE = re.compile(r"https?://github\.com/([^/]+)/([^/.]+?)(?:\.git)?$")
 
 
-def detect_language(target: Path) -> str | None:
+def _scan_root(target: Path) -> dict[str, bool]:
+    """Map each entry in target to whether it is a directory.
+
+    One scandir replaces the per-detector stat probes of the project root.
+    Broken symlinks are omitted, matching Path.exists().
+    """
+    root: dict[str, bool] = {}
+    try:
+        with os.scandir(target) as entries:
+            for e in entries:
+                if e.is_symlink() and not os.path.exists(e.path):
+                    continue
+                root[e.name] = e.is_dir()
+    except OSError:
+        pass
+    return root
+
+
+def detect_language(target: Path, *, root: dict[str, bool] | None = None) -> str | None:
     """Detect project language from marker files."""
+    if root is None:
+        root = _scan_root(target)
     for filename, language in _LANGUAGE_MARKERS:
-        if (target / filename).exists():
+        if filename in root:
             return language
     return None
 
@@ -51,15 +76,35 @@ def parse_github_url(url: str) -> tuple[str, str] | None:
     return None
 
 
-def detect_python_metadata(target: Path) -> dict[str, Any]:
-    """Extract project metadata from pyproject.toml."""
-    pyproject_path = target / "pyproject.toml"
-    if not pyproject_path.exists():
-        return {}
+def _load_pyproject(pyproject_path: Path) -> dict[str, Any] | None:
+    """Parse pyproject.toml. Returns None if unreadable.
 
+    inspect_project() calls this once and hands the result to each detector.
+    """
     try:
-        data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
+        return tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
     except (tomllib.TOMLDecodeError, UnicodeDecodeError, PermissionError, OSError):
+        return None
+
+
+def detect_python_metadata(
+    target: Path,
+    *,
+    root: dict[str, bool] | None = None,
+    pyproject: dict[str, Any] | None = None,
+) -> dict[str, Any]:
+    """Extract project metadata from pyproject.toml.
+
+    pyproject: the already-parsed pyproject.toml, if the caller has it.
+    """
+    if root is None:
+        root = _scan_root(target)
+    pyproject_path = target / "pyproject.toml"
+    if "pyproject.toml" not in root:
+        return {}
+
+    data = pyproject if pyproject is not None else _load_pyproject(pyproject_path)
+    if data is None:
         logger.warning("Failed to read or parse %s", pyproject_path)
         return {}
 
@@ -106,12 +151,9 @@ def detect_python_metadata(target: Path) -> dict[str, Any]:
     if runtime := project.get("dependencies"):
         deps["runtime"] = _extract_dep_names(runtime)
 
-    # Dev deps: prefer [dependency-groups].dev over [project.optional-dependencies].dev
-    dev_deps = data.get("dependency-groups", {}).get("dev")
-    if dev_deps is None:
-        dev_deps = project.get("optional-dependencies", {}).get("dev")
-    if dev_deps:
-        deps["dev"] = _extract_dep_names(dev_deps)
+    dev_deps = _get_dev_deps(data)
+    if dev_deps is not None:
+        deps["dev"] = dev_deps
 
     if deps:
         result["dependencies"] = deps
@@ -121,25 +163,29 @@ def detect_python_metadata(target: Path) -> dict[str, Any]:
 
     # src_dir: look for src/<package>/__init__.py
     # Prefer package matching project name (e.g. "my-project" → "my_project")
+    # One scandir pass; DirEntry.is_dir() reuses the type from the listing.
     src_dir = target / "src"
-    if src_dir.is_dir():
-        packages = [
-            c for c in sorted(src_dir.iterdir()) if c.is_dir() and (c / "__init__.py").exists()
-        ]
+    if root.get("src"):
+        with os.scandir(src_dir) as entries:
+            packages = sorted(
+                e.name
+                for e in entries
+                if e.is_dir() and os.path.exists(os.path.join(e.path, "__init__.py"))
+            )
         if packages:
             project_name = result.get("name", "")
             normalized = project_name.replace("-", "_")
-            match = next((p for p in packages if p.name == normalized), None)
-            structure["src_dir"] = f"src/{(match or packages[0]).name}"
+            match = normalized if normalized in packages else packages[0]
+            structure["src_dir"] = f"src/{match}"
 
     # test_dir: check pytest config first, then convention
     pytest_config = data.get("tool", {}).get("pytest", {}).get("ini_options", {})
     testpaths = pytest_config.get("testpaths", [])
     if testpaths and isinstance(testpaths[0], str):
         structure["test_dir"] = testpaths[0]
-    elif (target / "tests").is_dir():
+    elif root.get("tests"):
         structure["test_dir"] = "tests"
-    elif (target / "test").is_dir():
+    elif root.get("test"):
         structure["test_dir"] = "test"
 
     if structure:
@@ -148,8 +194,18 @@ def detect_python_metadata(target: Path) -> dict[str, Any]:
     return result
 
 
-def detect_existing_tools(target: Path) -> dict[str, bool]:
-    """Detect which dev tools are present in the project."""
+def detect_existing_tools(
+    target: Path,
+    *,
+    root: dict[str, bool] | None = None,
+    pyproject: dict[str, Any] | None = None,
+) -> dict[str, bool]:
+    """Detect which dev tools are present in the project.
+
+    pyproject: the already-parsed pyproject.toml, if the caller has it.
+    """
+    if root is None:
+        root = _scan_root(target)
     tools: dict[str, bool] = {
         "ruff": False,
         "mypy": False,
@@ -159,12 +215,10 @@ def detect_existing_tools(target: Path) -> dict[str, bool]:
     }
 
     # Parse pyproject.toml for tool sections and dev deps
-    pyproject_path = target / "pyproject.toml"
-    if pyproject_path.exists():
-        try:
-            data = tomllib.loads(pyproject_path.read_text(encoding="utf-8"))
-        except (tomllib.TOMLDecodeError, UnicodeDecodeError, PermissionError, OSError):
-            data = {}
+    if "pyproject.toml" in root:
+        if pyproject is None:
+            pyproject = _load_pyproject(target / "pyproject.toml")
+        data = pyproject or {}
 
         tool = data.get("tool", {})
         if "ruff" in tool:
@@ -173,64 +227,99 @@ def detect_existing_tools(target: Path) -> dict[str, bool]:
             tools["mypy"] = True
 
         # Check dev deps for bandit
-        dev_deps = data.get("dependency-groups", {}).get("dev", [])
-        if not dev_deps:
-            dev_deps = data.get("project", {}).get("optional-dependencies", {}).get("dev", [])
-        dep_names = _extract_dep_names(dev_deps)
-        if "bandit" in dep_names:
+        if "bandit" in (_get_dev_deps(data) or []):
             tools["bandit"] = True
 
     # File-based detection
-    if (target / ".pre-commit-config.yaml").exists():
+    if ".pre-commit-config.yaml" in root:
         tools["pre_commit"] = True
-    if (target / ".github" / "dependabot.yml").exists():
+    if root.get(".github") and (target / ".github" / "dependabot.yml").exists():
         tools["dependabot"] = True
 
     return tools
 
 
-def detect_features(target: Path) -> dict[str, bool]:
-    """Detect which features are active in the project."""
+def _list_workflows(target: Path) -> list[str] | None:
+    """Sorted workflow filenames in .github/workflows, or None if the dir is absent."""
+    wf_dir = target / ".github" / "workflows"
+    try:
+        with os.scandir(wf_dir) as entries:
+            return sorted(
+                e.name for e in entries if e.name.endswith((".yml", ".yaml")) and e.is_file()
+            )
+    except OSError:
+        return None
+
+
+def detect_features(
+    target: Path,
+    *,
+    workflows: list[str] | None = None,
+    root: dict[str, bool] | None = None,
+) -> dict[str, bool]:
+    """Detect which features are active in the project.
+
+    workflows: sorted workflow filenames in .github/workflows, if the caller
+    already has them.
+    """
+    if root is None:
+        root = _scan_root(target)
     features: dict[str, bool] = {
         "ci": False,
         "pre_commit": False,
     }
 
-    wf_dir = target / ".github" / "workflows"
-    if wf_dir.is_dir() and (any(wf_dir.glob("*.yml")) or any(wf_dir.glob("*.yaml"))):
+    if workflows is None and root.get(".github"):
+        workflows = _list_workflows(target)
+    if workflows:
         features["ci"] = True
 
-    if (target / ".pre-commit-config.yaml").exists():
+    if ".pre-commit-config.yaml" in root:
         features["pre_commit"] = True
 
     return features
 
 
-def detect_git_remote(target: Path) -> dict[str, str]:
-    """Get GitHub org/repo from git remote origin. Returns empty dict if unavailable."""
+def _git_query(target: Path, *args: str) -> str | None:
+    """Run `git -C target <args>` and return stripped stdout, or None on any failure.
+
+    Single entry point for git metadata so future detectors (branch, HEAD)
+    share the same error handling and timeout.
+    """
     try:
         result = subprocess.run(
-            ["git", "-C", str(target), "remote", "get-url", "origin"],
+            ["git", "-C", str(target), *args],
             capture_output=True,
             text=True,
-            check=True,
             timeout=10,
         )
-    except (subprocess.CalledProcessError, FileNotFoundError, subprocess.TimeoutExpired):
+    except (FileNotFoundError, subprocess.TimeoutExpired):
+        return None
+    if result.returncode != 0:
+        return None
+    return result.stdout.strip()
+
+
+def detect_git_remote(target: Path) -> dict[str, str]:
+    """Get GitHub org/repo from git remote origin. Returns empty dict if unavailable."""
+    url = _git_query(target, "remote", "get-url", "origin")
+    if url is None:
         return {}
 
-    parsed = parse_github_url(result.stdout.strip())
+    parsed = parse_github_url(url)
     if parsed:
         return {"org": parsed[0], "repo": parsed[1]}
     return {}
 
 
-def detect_test_info(target: Path) -> dict[str, Any]:
+def detect_test_info(target: Path, *, root: dict[str, bool] | None = None) -> dict[str, Any]:
     """Detect test framework, directory, and approximate test count."""
+    if root is None:
+        root = _scan_root(target)
     # Look for test directories
     test_dir = None
     for candidate in ("tests", "test"):
-        if (target / candidate).is_dir():
+        if root.get(candidate):
             test_dir = target / candidate
             break
 
@@ -239,17 +328,25 @@ def detect_test_info(target: Path) -> dict[str, Any]:
 
     # Count test functions in test_*.py files (skip symlinks, cap file size)
     count = 0
-    for test_file in test_dir.rglob("test_*.py"):
-        if test_file.is_symlink():
-            continue
-        try:
-            if test_file.stat().st_size > _MAX_TEST_FILE_SIZE:
-                logger.warning("Skipping oversized test file: %s", test_file)
+    for dirpath, dirnames, filenames in os.walk(test_dir):
+        # Prune in place so os.walk never descends into these
+        dirnames[:] = [d for d in dirnames if d not in _SKIP_TEST_DIRS]
+        for name in filenames:
+            if not (name.startswith("test_") and name.endswith(".py")):
                 continue
-            content = test_file.read_text(errors="replace")
-        except (PermissionError, OSError):
-            continue
-        count += len(re.findall(r"^\s*def test_", content, re.MULTILINE))
+            test_file = os.path.join(dirpath, name)
+            try:
+                st = os.lstat(test_file)
+                if stat.S_ISLNK(st.st_mode):
+                    continue
+                if st.st_size > _MAX_TEST_FILE_SIZE:
+                    logger.warning("Skipping oversized test file: %s", test_file)
+                    continue
+                with open(test_file, "rb") as f:
+                    content = f.read()
+            except (PermissionError, OSError):
+                continue
+            count += sum(1 for _ in _TEST_DEF_RE.finditer(content))
 
     return {
         "test_framework": "pytest",
@@ -260,19 +357,23 @@ def detect_test_info(target: Path) -> dict[str, Any]:
 def inspect_project(target: Path) -> dict[str, Any]:
     """Run all detectors and assemble a spec dict."""
     spec: dict[str, Any] = {}
+    root = _scan_root(target)
+    # Parsed once here; several detectors read it
+    pyproject = _load_pyproject(target / "pyproject.toml") if "pyproject.toml" in root else None
 
     # Language detection
-    language = detect_language(target)
+    language = detect_language(target, root=root)
     if language:
         spec["language"] = language
 
     # Language-specific metadata
     if language == "python":
-        metadata = detect_python_metadata(target)
+        metadata = detect_python_metadata(target, root=root, pyproject=pyproject)
         spec.update(metadata)
 
     # Features
-    features = detect_features(target)
+    workflows = _list_workflows(target) if root.get(".github") else None
+    features = detect_features(target, workflows=workflows, root=root)
     if any(features.values()):
         spec["features"] = features
 
@@ -284,19 +385,16 @@ def inspect_project(target: Path) -> dict[str, Any]:
     # Recon section
     recon: dict[str, Any] = {}
 
-    recon["existing_tools"] = detect_existing_tools(target)
-    recon["has_pyproject_toml"] = (target / "pyproject.toml").exists()
-    recon["has_github_dir"] = (target / ".github").is_dir()
+    recon["existing_tools"] = detect_existing_tools(target, root=root, pyproject=pyproject)
+    recon["has_pyproject_toml"] = "pyproject.toml" in root
+    recon["has_github_dir"] = root.get(".github", False)
 
     # Existing CI workflows
-    wf_dir = target / ".github" / "workflows"
-    if wf_dir.is_dir():
-        recon["existing_ci"] = sorted(
-            f.name for ext in ("*.yml", "*.yaml") for f in wf_dir.glob(ext)
-        )
+    if workflows is not None:
+        recon["existing_ci"] = workflows
 
     # Test info
-    test_info = detect_test_info(target)
+    test_info = detect_test_info(target, root=root)
     if test_info:
         recon.update(test_info)
 
@@ -307,6 +405,19 @@ def inspect_project(target: Path) -> dict[str, Any]:
     return spec
 
 
+def _get_dev_deps(data: dict[str, Any]) -> list[str] | None:
+    """Dev dependency names from parsed pyproject data. None if none are declared.
+
+    Prefers [dependency-groups].dev over [project.optional-dependencies].dev.
+    """
+    dev_deps = data.get("dependency-groups", {}).get("dev")
+    if dev_deps is None:
+        dev_deps = data.get("project", {}).get("optional-dependencies", {}).get("dev")
+    if not dev_deps:
+        return None
+    return _extract_dep_names(dev_deps)
+
+
 def _extract_dep_names(deps: list[str]) -> list[str]:
     """Extract package names from dependency specifiers, stripping version constraints."""
     names: list[str] = []
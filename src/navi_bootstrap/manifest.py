@@ -5,39 +5,80 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 from pathlib import Path
-from typing import Any
+from typing import IO, Any
 
 import jsonschema
 import yaml
+from jsonschema.protocols import Validator
 
 SCHEMA_PATH = Path(__file__).parent.parent.parent / "schema" / "manifest-schema.yaml"
 
+# libyaml's C loader when PyYAML was built with it; same safe semantics.
+_SafeLoader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+
+def _yaml_load(stream: str | bytes | IO[bytes]) -> Any:
+    """yaml.safe_load, using the C loader when available."""
+    return yaml.load(stream, Loader=_SafeLoader)  # nosec B506
+
 
 class ManifestError(Exception):
     """Raised when a manifest is invalid or cannot be loaded."""
 
 
+@functools.lru_cache(maxsize=1)
 def _load_schema() -> dict[str, Any]:
     """Load the YAML schema for manifest validation."""
-    return yaml.safe_load(SCHEMA_PATH.read_text())
+    return _yaml_load(SCHEMA_PATH.read_text())
+
+
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> Validator:
+    """Build the schema validator once; the schema itself is checked here, not per call."""
+    schema = _load_schema()
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
 
 
 def validate_manifest(manifest: dict[str, Any]) -> None:
     """Validate a manifest dict against the schema. Raises ManifestError on failure."""
-    schema = _load_schema()
-    try:
-        jsonschema.validate(instance=manifest, schema=schema)
-    except jsonschema.ValidationError as e:
-        raise ManifestError(f"Manifest validation failed: {e.message}") from e
+    # Same error selection as jsonschema.validate()
+    error = jsonschema.exceptions.best_match(_get_validator().iter_errors(manifest))
+    if error is not None:
+        raise ManifestError(f"Manifest validation failed: {error.message}") from error
 
 
 def load_manifest(path: Path) -> dict[str, Any]:
-    """Load and validate a manifest from a YAML file. Returns the manifest dict."""
-    if not path.exists():
-        raise ManifestError(f"Manifest file not found: {path}")
+    """Load and validate a manifest from a YAML file. Returns the manifest dict.
+
+    Results are memoized, best-effort, on the file's path, inode, mtime,
+    ctime and size, so repeated loads of an unchanged file in one process
+    skip parsing and validation. An in-place rewrite that keeps the size and
+    lands within the filesystem's timestamp granularity can still return
+    the previous parse. Each call
+    returns its own deep copy: sanitize_manifest() shares clean subtrees with its
+    input, and the result is handed to pack templates, so the cached parse
+    must never be reachable from a caller.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        raise ManifestError(f"Manifest file not found: {path}") from None
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    return copy.deepcopy(_load_manifest_cached(str(path.resolve()), stamp))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_manifest_cached(path: str, stamp: tuple[int, int, int, int]) -> dict[str, Any]:
+    """Parse and validate a manifest file. stamp is cache-key only."""
     try:
-        manifest = yaml.safe_load(path.read_text())
+        # The C loader reads the file in chunks; no full-text copy up front.
+        with open(path, "rb") as fp:
+            manifest = _yaml_load(fp)
     except yaml.YAMLError as e:
         raise ManifestError(f"Failed to parse manifest YAML: {e}") from e
     if not isinstance(manifest, dict):
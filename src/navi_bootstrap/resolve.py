@@ -7,8 +7,13 @@ from __future__ import annotations
 
 import json
 import subprocess
+from concurrent.futures import ThreadPoolExecutor
 from typing import Any
 
+# Each lookup is one or two blocking `gh api` round-trips, so resolving
+# a manifest's actions concurrently bounds wall time by the slowest one.
+_MAX_WORKERS = 8
+
 
 class ResolveError(Exception):
     """Raised when SHA resolution fails."""
@@ -41,6 +46,11 @@ def _resolve_one(repo: str, tag: str) -> str:
     return obj["sha"]
 
 
+def _resolve_entry(entry: dict[str, str]) -> str:
+    """Resolve one manifest action_shas entry to its commit SHA."""
+    return _resolve_one(entry["repo"], entry["tag"])
+
+
 def resolve_action_shas(
     action_shas: list[dict[str, str]], *, skip: bool = False
 ) -> tuple[dict[str, str], dict[str, str]]:
@@ -48,22 +58,32 @@ def resolve_action_shas(
 
     Returns (shas, versions) dicts keyed by action name.
     If skip=True, fills SHAs with placeholder strings (for dry-run/offline).
+    Lookups run concurrently; on failure the first failing entry in
+    manifest order is reported.
     """
     shas: dict[str, str] = {}
     versions: dict[str, str] = {}
 
     for entry in action_shas:
-        name = entry["name"]
-        versions[name] = entry["tag"]
-
-        if skip:
-            shas[name] = "SKIP_SHA_RESOLUTION"
-        else:
-            try:
-                shas[name] = _resolve_one(entry["repo"], entry["tag"])
-            except (ResolveError, KeyError, json.JSONDecodeError, FileNotFoundError) as e:
-                raise ResolveError(
-                    f"Failed to resolve SHA for {entry['repo']}@{entry['tag']}: {e}"
-                ) from e
+        versions[entry["name"]] = entry["tag"]
+
+    if skip:
+        for entry in action_shas:
+            shas[entry["name"]] = "SKIP_SHA_RESOLUTION"
+        return shas, versions
+
+    if not action_shas:
+        return shas, versions
+
+    with ThreadPoolExecutor(max_workers=min(_MAX_WORKERS, len(action_shas))) as pool:
+        futures = [pool.submit(_resolve_entry, entry) for entry in action_shas]
+
+    for entry, future in zip(action_shas, futures, strict=True):
+        try:
+            shas[entry["name"]] = future.result()
+        except (ResolveError, KeyError, json.JSONDecodeError, FileNotFoundError) as e:
+            raise ResolveError(
+                f"Failed to resolve SHA for {entry['repo']}@{entry['tag']}: {e}"
+            ) from e
 
     return shas, versions
@@ -12,7 +12,9 @@ from __future__ import annotations
 import logging
 import re
 import unicodedata
-from copy import deepcopy
+from collections.abc import Iterator
+from collections.abc import Set as AbstractSet
+from dataclasses import dataclass, field
 from typing import Any
 
 logger = logging.getLogger("navi_bootstrap.sanitize")
@@ -68,6 +70,8 @@ HOMOGLYPH_MAP: dict[str, str] = {
     "\u201d": '"',  # right double quote
 }
 
+_HOMOGLYPH_TABLE = str.maketrans(HOMOGLYPH_MAP)
+
 # Zero-width characters to strip
 ZERO_WIDTH_CHARS: set[str] = {
     "\u200b",  # zero-width space
@@ -78,23 +82,35 @@ ZERO_WIDTH_CHARS: set[str] = {
     "\u180e",  # Mongolian vowel separator
 }
 
-_ZERO_WIDTH_RE = re.compile("[" + "".join(ZERO_WIDTH_CHARS) + "]")
+# Null bytes, zero-width chars and homoglyphs are all codepoint → codepoint
+# (or deletion) maps, so one translate pass applies all three.
+_UNICODE_CLEAN_TABLE = {
+    **str.maketrans(dict.fromkeys(["\x00", *ZERO_WIDTH_CHARS])),
+    **_HOMOGLYPH_TABLE,
+}
 
 # Jinja2 delimiter patterns
 _JINJA2_DELIMITERS = re.compile(r"\{\{|\}\}|\{%|%\}|\{#|#\}")
 
+# Spec keys whose string values are treated as paths
+_SPEC_PATH_FIELDS = frozenset({"name", "src_dir", "test_dir", "docs_dir"})
+
+# Any char that a step of the pipeline could act on in ASCII text
+_NEEDS_WORK = re.compile(r"[{}%#\x00]")
 
-def _strip_null_bytes(s: str) -> tuple[str, bool]:
-    """Strip null bytes. Returns (cleaned, had_nulls)."""
-    if "\x00" in s:
-        return s.replace("\x00", ""), True
-    return s, False
 
+def _clean_codepoints(s: str) -> tuple[str, bool, bool, int]:
+    """Strip null bytes and zero-width chars and replace homoglyphs in one pass.
 
-def _strip_zero_width(s: str) -> tuple[str, bool]:
-    """Strip zero-width characters. Returns (cleaned, had_zero_width)."""
-    cleaned = _ZERO_WIDTH_RE.sub("", s)
-    return cleaned, cleaned != s
+    Returns (cleaned, had_nulls, had_zero_width, homoglyph_count).
+    """
+    cleaned = s.translate(_UNICODE_CLEAN_TABLE)
+    if cleaned == s:
+        return s, False, False, 0
+    removed = len(s) - len(cleaned)
+    nulls = s.count("\x00") if removed else 0
+    glyphs = sum(1 for ch in s if ch in HOMOGLYPH_MAP) if not s.isascii() else 0
+    return cleaned, nulls > 0, removed > nulls, glyphs
 
 
 def _normalize_fullwidth(s: str) -> tuple[str, bool]:
@@ -111,13 +127,11 @@ def _replace_homoglyphs(s: str) -> tuple[str, int]:
 
     Returns (cleaned, count_replaced).
     """
-    count = 0
-    chars = list(s)
-    for i, ch in enumerate(chars):
-        if ch in HOMOGLYPH_MAP:
-            chars[i] = HOMOGLYPH_MAP[ch]
-            count += 1
-    return "".join(chars), count
+    cleaned = s.translate(_HOMOGLYPH_TABLE)
+    if cleaned == s:
+        return s, 0
+    # Every mapping changes its char, so only count when something changed.
+    return cleaned, sum(1 for ch in s if ch in HOMOGLYPH_MAP)
 
 
 def _escape_jinja2(s: str) -> tuple[str, bool]:
@@ -128,6 +142,9 @@ def _escape_jinja2(s: str) -> tuple[str, bool]:
 
     Returns (escaped, had_delimiters).
     """
+    # Every delimiter contains a brace; skip the regex when there are none
+    if "{" not in s and "}" not in s:
+        return s, False
     if _JINJA2_DELIMITERS.search(s):
         escaped = s
         escaped = escaped.replace("{{", r"\{\{")
@@ -148,6 +165,10 @@ def _sanitize_path(s: str) -> tuple[str, bool]:
     original = s
     # Strip leading /
     s = s.lstrip("/")
+    # Fast path: no "." or ".." segment to drop
+    padded = f"/{s}/"
+    if "/./" not in padded and "/../" not in padded:
+        return s, s != original
     # Normalize and remove .. segments
     parts = s.split("/")
     clean_parts: list[str] = []
@@ -162,32 +183,37 @@ def _sanitize_path(s: str) -> tuple[str, bool]:
 def _sanitize_string(s: str, *, is_path: bool = False, escape_jinja: bool = True) -> str:
     """Apply the full sanitization pipeline to a single string.
 
-    Order matters: null bytes → zero-width → NFKC → homoglyphs → jinja2 → path.
-    Zero-width stripping before Jinja2 escaping prevents evasion via
-    zero-width chars inserted between delimiters.
+    Order matters: null bytes + zero-width + homoglyphs (one translate) →
+    NFKC → jinja2 → path. NFKC can itself produce homoglyphs (e.g.
+    mathematical bold Alpha → Greek Alpha), so the homoglyph map is applied
+    again whenever normalization changed the string. Zero-width stripping
+    before Jinja2 escaping prevents evasion via zero-width chars inserted
+    between delimiters.
 
     Args:
         is_path: Apply path traversal sanitization.
         escape_jinja: Escape Jinja2 delimiters. Set to False for manifest
             dest paths which are legitimately Jinja2 templates (pack-controlled).
     """
-    # 1. Null bytes
-    s, had_nulls = _strip_null_bytes(s)
+    # Fast path: most values are plain ASCII that no step would change
+    if not is_path and s.isascii() and not _NEEDS_WORK.search(s):
+        return s
+
+    # 1-2, 4. Null bytes, zero-width characters, homoglyphs
+    s, had_nulls, had_zw, glyph_count = _clean_codepoints(s)
     if had_nulls:
         logger.warning("Sanitized null byte(s) in value")
-
-    # 2. Zero-width characters
-    s, had_zw = _strip_zero_width(s)
     if had_zw:
         logger.warning("Stripped zero-width character(s) from value")
 
-    # 3. Fullwidth → ASCII (NFKC)
-    s, had_fw = _normalize_fullwidth(s)
-    if had_fw:
-        logger.warning("Normalized fullwidth character(s) in value")
+    # 3. Fullwidth → ASCII (NFKC); leaves ASCII untouched
+    if not s.isascii():
+        s, had_fw = _normalize_fullwidth(s)
+        if had_fw:
+            logger.warning("Normalized fullwidth character(s) in value")
+            s, extra = _replace_homoglyphs(s)
+            glyph_count += extra
 
-    # 4. Homoglyphs
-    s, glyph_count = _replace_homoglyphs(s)
     if glyph_count:
         logger.warning("Replaced %d homoglyph(s) in value", glyph_count)
 
@@ -206,58 +232,91 @@ def _sanitize_string(s: str, *, is_path: bool = False, escape_jinja: bool = True
     return s
 
 
-def _walk_and_sanitize(
-    obj: Any,
-    *,
-    path_fields: set[str] | None = None,
-    _current_key: str = "",
-) -> Any:
-    """Recursively walk a dict/list and sanitize all string values."""
-    if path_fields is None:
-        path_fields = set()
-
-    if isinstance(obj, dict):
-        return {
-            k: _walk_and_sanitize(
-                v,
-                path_fields=path_fields,
-                _current_key=k,
-            )
-            for k, v in obj.items()
-        }
-    if isinstance(obj, list):
-        return [
-            _walk_and_sanitize(
-                item,
-                path_fields=path_fields,
-                _current_key=_current_key,
-            )
-            for item in obj
-        ]
+@dataclass
+class _Frame:
+    """A container being rebuilt by _walk_and_sanitize."""
+
+    src: dict[Any, Any] | list[Any]
+    key: Any  # nearest enclosing dict key, used for path_fields matching
+    children: Iterator[tuple[Any, Any]]
+    values: list[Any] = field(default_factory=list)
+    changed: bool = False
+
+
+def _frame(container: dict[Any, Any] | list[Any], key: Any) -> _Frame:
+    children = iter(container.items()) if isinstance(container, dict) else enumerate(container)
+    return _Frame(src=container, key=key, children=children)
+
+
+def _walk_and_sanitize(obj: Any, *, path_fields: AbstractSet[str] = frozenset()) -> Any:
+    """Walk a dict/list tree and return it with all string values sanitized.
+
+    Structurally shared: a container is copied only if something beneath it
+    changed, otherwise the original object is returned, so callers must not
+    mutate the result in place. Iterative (explicit stack, post-order)
+    rather than recursive: no per-node frame setup and no RecursionError on
+    deeply nested input. A string is treated as a path when the nearest
+    enclosing dict key is in path_fields; list items inherit their list's key.
+    """
     if isinstance(obj, str):
-        is_path = _current_key in path_fields
-        return _sanitize_string(obj, is_path=is_path)
-    return obj
+        return _sanitize_string(obj, is_path="" in path_fields)
+    if not isinstance(obj, (dict, list)):
+        return obj
+
+    stack = [_frame(obj, "")]
+    while True:
+        top = stack[-1]
+        is_dict = isinstance(top.src, dict)
+        for k, v in top.children:
+            child_key = k if is_dict else top.key
+            if isinstance(v, (dict, list)):
+                stack.append(_frame(v, child_key))
+                break
+            if isinstance(v, str):
+                new = _sanitize_string(v, is_path=child_key in path_fields)
+                if new != v:
+                    top.changed = True
+                    v = new
+            top.values.append(v)
+        else:
+            # All children done: rebuild only if one of them changed
+            stack.pop()
+            result: Any = top.src
+            if top.changed:
+                result = dict(zip(top.src, top.values, strict=True)) if is_dict else top.values
+            if not stack:
+                return result
+            stack[-1].values.append(result)
+            if result is not top.src:
+                stack[-1].changed = True
 
 
 def sanitize_spec(spec_data: dict[str, Any]) -> dict[str, Any]:
-    """Sanitize a loaded spec dict. Returns cleaned copy.
+    """Sanitize a loaded spec dict. Returns the cleaned spec.
 
     Applies: null byte stripping, zero-width removal, NFKC normalization,
     homoglyph replacement, Jinja2 delimiter escaping, path traversal
     prevention (on name, module names, structure paths).
+
+    Subtrees with nothing to clean are shared with spec_data (a fully clean
+    spec is returned as-is); spec_data itself is never mutated.
     """
-    spec = deepcopy(spec_data)
-    path_fields = {"name", "src_dir", "test_dir", "docs_dir"}
-    result: dict[str, Any] = _walk_and_sanitize(spec, path_fields=path_fields)
+    result: dict[str, Any] = _walk_and_sanitize(spec_data, path_fields=_SPEC_PATH_FIELDS)
 
     # Extra path sanitization for modules[*].name
     if "modules" in result and isinstance(result["modules"], list):
+        modules: list[Any] = []
+        changed = False
         for mod in result["modules"]:
             if isinstance(mod, dict) and "name" in mod and isinstance(mod["name"], str):
-                mod["name"], had_traversal = _sanitize_path(mod["name"])
+                name, had_traversal = _sanitize_path(mod["name"])
                 if had_traversal:
                     logger.warning("Sanitized path traversal in module name")
+                    mod = {**mod, "name": name}
+                    changed = True
+            modules.append(mod)
+        if changed:
+            result = {**result, "modules": modules}
 
     return result
 
@@ -268,8 +327,11 @@ def sanitize_manifest(manifest_data: dict[str, Any]) -> dict[str, Any]:
     Applies: null byte stripping, zero-width removal, NFKC normalization,
     homoglyph replacement, Jinja2 delimiter escaping on non-template fields,
     path traversal prevention on template dest paths.
+
+    Only the containers that are rewritten are copied; other nested values
+    are shared with manifest_data, which is never mutated.
     """
-    manifest = deepcopy(manifest_data)
+    manifest = {**manifest_data}
 
     # Sanitize string fields (description, etc.)
     for key in ("name", "description", "version"):
@@ -278,10 +340,12 @@ def sanitize_manifest(manifest_data: dict[str, Any]) -> dict[str, Any]:
 
     # Sanitize template dest paths
     if "templates" in manifest and isinstance(manifest["templates"], list):
+        templates: list[Any] = []
         for entry in manifest["templates"]:
-            if isinstance(entry, dict) and "dest" in entry:
-                dest = entry["dest"]
-                if isinstance(dest, str):
-                    entry["dest"] = _sanitize_string(dest, is_path=True, escape_jinja=False)
+            if isinstance(entry, dict) and isinstance(entry.get("dest"), str):
+                dest = _sanitize_string(entry["dest"], is_path=True, escape_jinja=False)
+                entry = {**entry, "dest": dest}
+            templates.append(entry)
+        manifest["templates"] = templates
 
     return manifest
@@ -5,11 +5,14 @@
 
 from __future__ import annotations
 
+import copy
+import functools
 import json
 from pathlib import Path
 from typing import Any
 
 import jsonschema
+from jsonschema.protocols import Validator
 
 SCHEMA_PATH = Path(__file__).parent.parent.parent / "schema" / "spec-schema.json"
 
@@ -18,26 +21,55 @@ class SpecError(Exception):
     """Raised when a spec is invalid or cannot be loaded."""
 
 
+@functools.lru_cache(maxsize=1)
 def _load_schema() -> dict[str, Any]:
     """Load the JSON Schema for spec validation."""
     return json.loads(SCHEMA_PATH.read_text())
 
 
+@functools.lru_cache(maxsize=1)
+def _get_validator() -> Validator:
+    """Build the schema validator once; the schema itself is checked here, not per call."""
+    schema = _load_schema()
+    cls = jsonschema.validators.validator_for(schema)
+    cls.check_schema(schema)
+    return cls(schema)
+
+
 def validate_spec(spec: dict[str, Any]) -> None:
     """Validate a spec dict against the JSON Schema. Raises SpecError on failure."""
-    schema = _load_schema()
-    try:
-        jsonschema.validate(instance=spec, schema=schema)
-    except jsonschema.ValidationError as e:
-        raise SpecError(f"Spec validation failed: {e.message}") from e
+    # Same error selection as jsonschema.validate()
+    error = jsonschema.exceptions.best_match(_get_validator().iter_errors(spec))
+    if error is not None:
+        raise SpecError(f"Spec validation failed: {error.message}") from error
 
 
 def load_spec(path: Path) -> dict[str, Any]:
-    """Load and validate a spec from a JSON file. Returns the spec dict."""
-    if not path.exists():
-        raise SpecError(f"Spec file not found: {path}")
+    """Load and validate a spec from a JSON file. Returns the spec dict.
+
+    Results are memoized, best-effort, on the file's path, inode, mtime,
+    ctime and size, so repeated loads of an unchanged file in one process
+    skip parsing and validation. An in-place rewrite that keeps the size and
+    lands within the filesystem's timestamp granularity can still return
+    the previous parse. Each call
+    returns its own deep copy: sanitize_spec() shares clean subtrees with its
+    input, and the result is handed to pack templates, so the cached parse
+    must never be reachable from a caller.
+    """
+    try:
+        st = path.stat()
+    except OSError:
+        raise SpecError(f"Spec file not found: {path}") from None
+    stamp = (st.st_ino, st.st_mtime_ns, st.st_ctime_ns, st.st_size)
+    return copy.deepcopy(_load_spec_cached(str(path.resolve()), stamp))
+
+
+@functools.lru_cache(maxsize=32)
+def _load_spec_cached(path: str, stamp: tuple[int, int, int, int]) -> dict[str, Any]:
+    """Parse and validate a spec file. stamp is cache-key only."""
     try:
-        spec = json.loads(path.read_text())
+        with open(path, "rb") as fp:
+            spec = json.load(fp)
     except json.JSONDecodeError as e:
         raise SpecError(f"Failed to parse spec JSON: {e}") from e
     validate_spec(spec)
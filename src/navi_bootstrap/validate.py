@@ -5,11 +5,33 @@
 
 from __future__ import annotations
 
+import re
+import shlex
+import shutil
 import subprocess
 from dataclasses import dataclass
 from pathlib import Path
 from typing import Any
 
+# Anything the shell would interpret (quoting, expansion, redirection, control
+# operators, env assignments). Commands containing these still go through sh.
+_SHELL_META_RE = re.compile(r"[|&;<>()$`\\\"'*?\[\]{}#~=%!\n]")
+
+
+def _command_argv(command: str) -> list[str] | None:
+    """Split a plain command into argv so it can run without a shell.
+
+    Returns None when the command needs shell semantics, its program is a
+    path (resolved against the validation's working_dir, not ours), or it
+    is not an executable on PATH (e.g. a shell builtin).
+    """
+    if _SHELL_META_RE.search(command):
+        return None
+    argv = shlex.split(command)
+    if not argv or "/" in argv[0] or shutil.which(argv[0]) is None:
+        return None
+    return argv
+
 
 @dataclass
 class ValidationResult:
@@ -38,10 +60,12 @@ def run_validations(validations: list[dict[str, Any]], working_dir: Path) -> lis
         command = v["command"]
         expect = v.get("expect", "exit_code_0")
 
+        # Plain commands skip the intermediate /bin/sh process
+        argv = _command_argv(command)
         try:
             result = subprocess.run(
-                command,
-                shell=True,  # nosec B602
+                argv if argv is not None else command,
+                shell=argv is None,  # nosec B602
                 capture_output=True,
                 text=True,
                 cwd=working_dir,
@@ -57,6 +81,19 @@ def run_validations(validations: list[dict[str, Any]], working_dir: Path) -> lis
                 )
             )
             continue
+        except OSError as exc:
+            if argv is None:
+                raise
+            # Match the shell's "not found" result instead of crashing
+            results.append(
+                ValidationResult(
+                    description=description,
+                    passed=False,
+                    stderr=str(exc),
+                    returncode=127,
+                )
+            )
+            continue
 
         if expect == "exit_code_0":
             passed = result.returncode == 0
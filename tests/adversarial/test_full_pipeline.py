@@ -16,6 +16,7 @@ import pytest
 import yaml
 
 from navi_bootstrap.engine import plan, render_to_files
+from navi_bootstrap.manifest import load_manifest
 from navi_bootstrap.sanitize import sanitize_manifest, sanitize_spec
 
 
@@ -61,7 +62,7 @@ class TestFullPipelineHostileSpec:
         with caplog.at_level(logging.WARNING, logger="navi_bootstrap.sanitize"):
             spec = sanitize_spec(spec)
 
-        manifest = yaml.safe_load((hostile_pack / "manifest.yaml").read_text())
+        manifest = load_manifest(hostile_pack / "manifest.yaml")
         templates_dir = hostile_pack / "templates"
         render_plan = plan(manifest, spec, templates_dir)
         rendered = render_to_files(render_plan, spec, templates_dir)
@@ -83,7 +84,7 @@ class TestFullPipelineHostileSpec:
         with caplog.at_level(logging.WARNING, logger="navi_bootstrap.sanitize"):
             spec = sanitize_spec(spec)
 
-        manifest = yaml.safe_load((hostile_pack / "manifest.yaml").read_text())
+        manifest = load_manifest(hostile_pack / "manifest.yaml")
         templates_dir = hostile_pack / "templates"
         render_plan = plan(manifest, spec, templates_dir)
         rendered = render_to_files(render_plan, spec, templates_dir)
@@ -104,7 +105,7 @@ class TestFullPipelineHostileSpec:
         with caplog.at_level(logging.WARNING, logger="navi_bootstrap.sanitize"):
             clean_spec = sanitize_spec(hostile_spec)
 
-        manifest = yaml.safe_load((hostile_pack / "manifest.yaml").read_text())
+        manifest = load_manifest(hostile_pack / "manifest.yaml")
         templates_dir = hostile_pack / "templates"
         render_plan = plan(manifest, clean_spec, templates_dir)
         rendered = render_to_files(render_plan, clean_spec, templates_dir)
@@ -52,6 +52,25 @@ class TestSpecPathTraversal:
         assert ".." not in result["structure"]["test_dir"]
         assert "path traversal" in caplog.text.lower()
 
+    def test_input_not_mutated(self) -> None:
+        """Loaded specs are cached by load_spec, so sanitizing must not write back."""
+        spec = {"name": "test", "language": "python", "modules": [{"name": "../core"}]}
+        result = sanitize_spec(spec)
+        assert result["modules"][0]["name"] == "core"
+        assert spec["modules"][0]["name"] == "../core"
+
+    def test_clean_subtrees_shared(self) -> None:
+        spec = {
+            "name": "../test",
+            "language": "python",
+            "structure": {"src_dir": "src", "test_dir": "tests"},
+            "modules": [{"name": "core"}],
+        }
+        result = sanitize_spec(spec)
+        assert result is not spec
+        assert result["structure"] is spec["structure"]
+        assert result["modules"] is spec["modules"]
+
 
 class TestManifestPathTraversal:
     """Path traversal in manifest dest paths."""
@@ -90,6 +109,16 @@ class TestManifestPathTraversal:
             assert ".." not in t["dest"]
             assert not t["dest"].startswith("/")
 
+    def test_input_not_mutated(self) -> None:
+        """Loaded manifests are cached by load_manifest, so sanitizing must not write back."""
+        manifest = {
+            "name": "test-pack",
+            "templates": [{"src": "a.j2", "dest": "../../a.txt"}],
+        }
+        result = sanitize_manifest(manifest)
+        assert result["templates"][0]["dest"] == "a.txt"
+        assert manifest["templates"][0]["dest"] == "../../a.txt"
+
 
 class TestNullBytes:
     """Null bytes are stripped from all string values."""
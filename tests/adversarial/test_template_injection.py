@@ -91,6 +91,26 @@ class TestJinja2DelimiterEscaping:
             result = sanitize_spec(spec)
         assert "{{" not in result["name"]
 
+    def test_deeply_nested_value_escaped(self) -> None:
+        """Nesting depth must not hit the recursion limit or skip sanitization."""
+        leaf: dict[str, object] = {"description": "{{ config }}"}
+        node = leaf
+        for _ in range(5000):
+            node = {"child": node}
+        result = sanitize_spec({"name": "test", "language": "python", "recon": node})
+        current = result["recon"]
+        while "child" in current:
+            current = current["child"]
+        assert "{{" not in current["description"]
+
+    @pytest.mark.parametrize("payload", ["{{%", "{{#", "{%}}", "%}}", "#}}", "{{{%", "}} #}"])
+    def test_overlapping_delimiters_fully_escaped(self, payload: str) -> None:
+        """Escaping one delimiter must not leave a raw one formed with its neighbour."""
+        spec = {"name": "test", "language": "python", "description": payload}
+        result = sanitize_spec(spec)
+        for delim in ("{{", "}}", "{%", "%}", "{#", "#}"):
+            assert delim not in result["description"]
+
 
 class TestMixedAttackVectors:
     """Combined attacks: template injection + unicode + path traversal."""
@@ -61,6 +61,17 @@ class TestHomoglyphNormalization:
             result = sanitize_spec(spec)
         assert result["description"] == "ao"
 
+    def test_homoglyph_produced_by_nfkc(self, caplog: pytest.LogCaptureFixture) -> None:
+        spec = {
+            "name": "test",
+            "language": "python",
+            "description": "\U0001d6a8BC",  # MATHEMATICAL BOLD CAPITAL ALPHA → Α → A
+        }
+        with caplog.at_level(logging.WARNING, logger="navi_bootstrap.sanitize"):
+            result = sanitize_spec(spec)
+        assert result["description"] == "ABC"
+        assert "homoglyph" in caplog.text.lower()
+
 
 class TestZeroWidthStripping:
     """Zero-width characters are stripped from all string values."""
@@ -90,6 +101,14 @@ class TestZeroWidthStripping:
             result = sanitize_spec(spec)
         assert result["recon"]["test_framework"] == "pytest"
 
+    def test_null_and_zero_width_both_reported(self, caplog: pytest.LogCaptureFixture) -> None:
+        spec = {"name": "te\x00s\u200bt", "language": "python"}
+        with caplog.at_level(logging.WARNING, logger="navi_bootstrap.sanitize"):
+            result = sanitize_spec(spec)
+        assert result["name"] == "test"
+        assert "null byte" in caplog.text.lower()
+        assert "zero-width" in caplog.text.lower()
+
 
 class TestFullwidthNormalization:
     """Fullwidth ASCII characters are normalized to regular ASCII."""
@@ -7,7 +7,6 @@ from pathlib import Path
 from typing import Any
 
 import pytest
-import yaml
 
 
 @pytest.fixture
@@ -56,7 +55,8 @@ def minimal_manifest_dir(tmp_path: Path) -> Path:
         "hooks": [],
     }
 
-    (pack_dir / "manifest.yaml").write_text(yaml.dump(manifest))
+    # JSON is valid YAML, and json.dumps skips PyYAML's pure-Python emitter
+    (pack_dir / "manifest.yaml").write_text(json.dumps(manifest, indent=2))
     (templates_dir / "hello.txt.j2").write_text("Hello {{ spec.name }}!\n")
 
     return pack_dir
@@ -67,6 +67,17 @@ class TestPathConfinement:
         assert len(written) == 1
         assert (output_dir / "src" / "deep" / "file.txt").read_text() == "ok\n"
 
+    def test_symlinked_output_dir_allowed(self, tmp_path: Path) -> None:
+        real_dir = tmp_path / "real"
+        real_dir.mkdir()
+        output_dir = tmp_path / "output"
+        output_dir.symlink_to(real_dir)
+        files = [RenderedFile(dest="a.txt", content="ok\n"), RenderedFile(dest="b.txt", content="")]
+
+        written = write_rendered(files, output_dir, "test-pack")
+        assert len(written) == 2
+        assert (real_dir / "a.txt").read_text() == "ok\n"
+
 
 # --- H2: spec.name as output dir ---
 
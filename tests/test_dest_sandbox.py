@@ -50,8 +50,20 @@ class TestDestPathSandbox:
         result = _render_dest_path("{{ spec.name }}/README.md", context)
         assert result == "myapp/README.md"
 
+    def test_static_dest_returned_unchanged(self) -> None:
+        context: dict[str, Any] = {"spec": {"name": "test"}}
+        assert _render_dest_path(".github/workflows/ci.yml", context) == (
+            ".github/workflows/ci.yml"
+        )
+
     def test_strict_undefined_still_enforced(self) -> None:
         """StrictUndefined must still raise on missing variables."""
         context: dict[str, Any] = {"spec": {"name": "test"}}
         with pytest.raises(jinja2.exceptions.UndefinedError):
             _render_dest_path("{{ nonexistent }}/file.py", context)
+
+    def test_cached_template_renders_each_context(self) -> None:
+        """A reused dest template must render against each call's own context."""
+        dest = "src/{{ item.name }}.py"
+        assert _render_dest_path(dest, {"item": {"name": "a"}}) == "src/a.py"
+        assert _render_dest_path(dest, {"item": {"name": "b"}}) == "src/b.py"
@@ -5,10 +5,33 @@
 
 from __future__ import annotations
 
+import re
 from pathlib import Path
 
 from navi_bootstrap.engine import RenderedFile
 
+_HUNK_RE = re.compile(r"^@@ -(\d+)(?:,(\d+))? \+\d+(?:,\d+)? @@")
+
+
+def _apply_unified_diff(old_lines: list[str], diff_text: str) -> list[str]:
+    """Apply a unified diff to old_lines, checking every context/removed line."""
+    result: list[str] = []
+    pos = 0
+    for line in diff_text.splitlines(keepends=True)[2:]:
+        m = _HUNK_RE.match(line)
+        if m:
+            start = int(m[1]) - (0 if m[2] == "0" else 1)
+            result.extend(old_lines[pos:start])
+            pos = start
+        elif line.startswith("+"):
+            result.append(line[1:])
+        else:
+            assert old_lines[pos] == line[1:]
+            if line.startswith(" "):
+                result.append(line[1:])
+            pos += 1
+    return result + old_lines[pos:]
+
 
 class TestDiffNewFile:
     """New files (not on disk) show as full additions."""
@@ -81,6 +104,46 @@ class TestDiffChangedFile:
         assert "--- a/hello.txt" in diffs[0].diff_text
         assert "+++ b/hello.txt" in diffs[0].diff_text
 
+    def test_large_file_diff_hunks_and_content(self, tmp_path: Path) -> None:
+        """Trimmed diffs keep full-file hunk numbers; here they equal difflib's."""
+        import difflib
+
+        from navi_bootstrap.diff import compute_diffs
+
+        old_lines = [f"line {i}\n" for i in range(500)]
+        new_lines = list(old_lines)
+        new_lines[200] = "changed 200\n"
+        new_lines[203:205] = ["inserted\n"]
+        new_lines[420] = "changed 420\n"
+        (tmp_path / "big.txt").write_text("".join(old_lines))
+
+        rendered = [RenderedFile(dest="big.txt", content="".join(new_lines))]
+        diffs = compute_diffs(rendered, tmp_path, pack_name="test-pack")
+
+        expected = "".join(
+            difflib.unified_diff(old_lines, new_lines, fromfile="a/big.txt", tofile="b/big.txt")
+        )
+        assert diffs[0].diff_text == expected
+        assert "@@ -198,11 +198,10 @@" in diffs[0].diff_text
+        assert _apply_unified_diff(old_lines, diffs[0].diff_text) == new_lines
+
+    def test_repeated_lines_diff_applies(self, tmp_path: Path) -> None:
+        """With repeated lines trimming may align differently from difflib.
+
+        The alignment is not guaranteed; the diff must still turn the old
+        file into the new one.
+        """
+        from navi_bootstrap.diff import compute_diffs
+
+        old_lines = ["a\n", "a\n", "a\n", "b\n"]
+        new_lines = ["b\n", "a\n", "a\n", "a\n", "a\n", "b\n"]
+        (tmp_path / "f.txt").write_text("".join(old_lines))
+
+        rendered = [RenderedFile(dest="f.txt", content="".join(new_lines))]
+        diff_text = compute_diffs(rendered, tmp_path, pack_name="test-pack")[0].diff_text
+
+        assert _apply_unified_diff(old_lines, diff_text) == new_lines
+
 
 class TestDiffAppendMode:
     """Append-mode files compute the full result with markers, then diff."""
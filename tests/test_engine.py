@@ -8,7 +8,7 @@ from typing import Any
 import pytest
 import yaml
 
-from navi_bootstrap.engine import plan, render
+from navi_bootstrap.engine import RenderedFile, plan, render, write_rendered
 
 # --- Fixtures ---
 
@@ -274,3 +274,13 @@ class TestRender:
             mode="apply",
         )
         assert (output_dir / "hello.txt").exists()
+
+    def test_write_rendered_encodes_utf8(self, tmp_path: Path) -> None:
+        files = [
+            RenderedFile(dest=".github/workflows/a.yml", content="name: café ✓\n"),
+            RenderedFile(dest=".github/workflows/b.yml", content="name: b\n"),
+        ]
+        write_rendered(files, tmp_path, "test-pack")
+        workflows = tmp_path / ".github" / "workflows"
+        assert (workflows / "a.yml").read_bytes() == "name: café ✓\n".encode()
+        assert (workflows / "b.yml").read_bytes() == b"name: b\n"
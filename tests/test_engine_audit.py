@@ -121,6 +121,18 @@ class TestPackNameRegexSafety:
         assert result.count("# --- nboot: pack+extra ---") == 1
         assert "new" in result
 
+    def test_unterminated_block_is_left_in_place(self, tmp_path: Path) -> None:
+        """A start marker with no end marker is not stripped to end of file."""
+        target = tmp_path / "config.toml"
+        target.write_text("# --- nboot: pack-a ---\nkeep-me\n")
+        _write_append(target, "content\n", "pack-a")
+
+        result = target.read_text()
+        assert result == (
+            "# --- nboot: pack-a ---\nkeep-me\n"
+            "# --- nboot: pack-a ---\ncontent\n# --- end nboot: pack-a ---\n"
+        )
+
 
 # --- Bug #3: _eval_condition with double negation ---
 
@@ -174,6 +186,11 @@ class TestResolveDotpathEdgeCases:
         result = _resolve_dotpath(obj, "spec.name")
         assert result is None
 
+    def test_pre_split_parts(self) -> None:
+        obj = {"spec": {"features": {"ci": True}}}
+        assert _resolve_dotpath(obj, ("spec", "features", "ci")) is True
+        assert _resolve_dotpath(obj, ()) is obj
+
 
 # --- Bug #5: plan() with empty/edge-case manifests ---
 
@@ -125,6 +125,11 @@ class TestDetectLanguage:
     def test_no_language_detected(self, tmp_path: Path) -> None:
         assert detect_language(tmp_path) is None
 
+    def test_broken_symlink_marker_ignored(self, tmp_path: Path) -> None:
+        (tmp_path / "pyproject.toml").symlink_to(tmp_path / "missing.toml")
+        (tmp_path / "go.mod").write_text("module example.com/x\n")
+        assert detect_language(tmp_path) == "go"
+
     def test_python_preferred_when_both_pyproject_and_package_json(self, tmp_path: Path) -> None:
         (tmp_path / "pyproject.toml").write_text("[project]\nname = 'x'\n")
         (tmp_path / "package.json").write_text('{"name": "x"}\n')
@@ -449,6 +454,17 @@ class TestDetectTestInfo:
         result = detect_test_info(tmp_path)
         assert result["test_count"] == 1
 
+    def test_skips_symlinks_and_vendored_dirs(self, tmp_path: Path) -> None:
+        tests = tmp_path / "tests"
+        (tests / "unit").mkdir(parents=True)
+        (tests / "unit" / "test_core.py").write_text("def test_it(): pass\n")
+        (tests / "test_link.py").symlink_to(tests / "unit" / "test_core.py")
+        for skipped in ("__pycache__", ".venv", "node_modules"):
+            (tests / skipped).mkdir()
+            (tests / skipped / "test_x.py").write_text("def test_x(): pass\n")
+        result = detect_test_info(tmp_path)
+        assert result["test_count"] == 1
+
 
 # ---------------------------------------------------------------------------
 # TestInspectProject
@@ -499,6 +515,21 @@ class TestInspectProject:
         result = inspect_project(tmp_path)
         assert result["recon"]["has_github_dir"] is True
 
+    def test_pyproject_parsed_once(self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+        import tomllib
+
+        _make_python_project(tmp_path)
+        calls: list[str] = []
+        real_loads = tomllib.loads
+
+        def counting_loads(text: str) -> dict[str, object]:
+            calls.append(text)
+            return real_loads(text)
+
+        monkeypatch.setattr(tomllib, "loads", counting_loads)
+        inspect_project(tmp_path)
+        assert len(calls) == 1
+
 
 # ---------------------------------------------------------------------------
 # TestInitCommand (CLI integration)
@@ -2,13 +2,20 @@
 
 from __future__ import annotations
 
+import os
 from pathlib import Path
 from typing import Any
 
 import pytest
 import yaml
 
-from navi_bootstrap.manifest import ManifestError, load_manifest, validate_manifest
+from navi_bootstrap.manifest import (
+    ManifestError,
+    _load_manifest_cached,
+    load_manifest,
+    validate_manifest,
+)
+from navi_bootstrap.sanitize import sanitize_manifest
 
 
 @pytest.fixture
@@ -91,3 +98,61 @@ class TestLoadManifest:
         manifest_file.write_text(yaml.dump({"name": "test"}))
         with pytest.raises(ManifestError):
             load_manifest(manifest_file)
+
+    def test_repeated_load_is_cached(self, tmp_path: Path, valid_manifest: dict[str, Any]) -> None:
+        manifest_file = tmp_path / "manifest.yaml"
+        manifest_file.write_text(yaml.dump(valid_manifest))
+        load_manifest(manifest_file)
+        before = _load_manifest_cached.cache_info()
+        assert load_manifest(manifest_file) == valid_manifest
+        after = _load_manifest_cached.cache_info()
+        assert (after.hits, after.misses) == (before.hits + 1, before.misses)
+
+    def test_mutating_sanitized_result_does_not_leak(
+        self, tmp_path: Path, valid_manifest: dict[str, Any]
+    ) -> None:
+        manifest_file = tmp_path / "manifest.yaml"
+        manifest_file.write_text(yaml.dump(valid_manifest))
+        result = sanitize_manifest(load_manifest(manifest_file))
+        result["templates"][0]["dest"] = "MUTATED"
+        result["name"] = "other"
+        assert load_manifest(manifest_file) == valid_manifest
+
+    def test_modified_file_is_reloaded(
+        self, tmp_path: Path, valid_manifest: dict[str, Any]
+    ) -> None:
+        manifest_file = tmp_path / "manifest.yaml"
+        manifest_file.write_text(yaml.dump(valid_manifest))
+        assert load_manifest(manifest_file)["name"] == "test-pack"
+
+        manifest_file.write_text(yaml.dump({**valid_manifest, "name": "renamed"}))
+        st = manifest_file.stat()
+        os.utime(manifest_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_manifest(manifest_file)["name"] == "renamed"
+
+    def test_resized_file_with_same_mtime_is_reloaded(
+        self, tmp_path: Path, valid_manifest: dict[str, Any]
+    ) -> None:
+        manifest_file = tmp_path / "manifest.yaml"
+        manifest_file.write_text(yaml.dump(valid_manifest))
+        mtime_ns = manifest_file.stat().st_mtime_ns
+        assert load_manifest(manifest_file)["name"] == "test-pack"
+
+        manifest_file.write_text(yaml.dump({**valid_manifest, "name": "renamed-longer"}))
+        os.utime(manifest_file, ns=(mtime_ns, mtime_ns))
+        assert load_manifest(manifest_file)["name"] == "renamed-longer"
+
+    def test_replaced_file_with_same_size_and_mtime_is_reloaded(
+        self, tmp_path: Path, valid_manifest: dict[str, Any]
+    ) -> None:
+        manifest_file = tmp_path / "manifest.yaml"
+        manifest_file.write_text(yaml.dump(valid_manifest))
+        mtime_ns = manifest_file.stat().st_mtime_ns
+        assert load_manifest(manifest_file)["name"] == "test-pack"
+
+        # Same length name, written elsewhere and swapped in (new inode)
+        replacement = tmp_path / "replacement"
+        replacement.write_text(yaml.dump({**valid_manifest, "name": "best-pack"}))
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        os.replace(replacement, manifest_file)
+        assert load_manifest(manifest_file)["name"] == "best-pack"
@@ -3,6 +3,7 @@
 from __future__ import annotations
 
 import json
+import threading
 from unittest.mock import MagicMock, patch
 
 import pytest
@@ -32,10 +33,14 @@ class TestResolveActionShas:
     ) -> None:
         sha1 = "a" * 40
         sha2 = "b" * 40
-        mock_run.side_effect = [
-            MagicMock(returncode=0, stdout=_make_gh_response(sha1)),
-            MagicMock(returncode=0, stdout=_make_gh_response(sha2)),
-        ]
+        by_endpoint = {
+            "repos/actions/checkout/git/refs/tags/v4.2.2": sha1,
+            "repos/step-security/harden-runner/git/refs/tags/v2.10.4": sha2,
+        }
+        # Lookups run concurrently, so answer by endpoint rather than call order
+        mock_run.side_effect = lambda cmd, **_: MagicMock(
+            returncode=0, stdout=_make_gh_response(by_endpoint[cmd[2]])
+        )
         shas, versions = resolve_action_shas(action_shas_config)
         assert shas["actions_checkout"] == sha1
         assert shas["harden_runner"] == sha2
@@ -73,6 +78,24 @@ class TestResolveActionShas:
         with pytest.raises(ResolveError, match="actions/checkout"):
             resolve_action_shas(action_shas_config)
 
+    @patch("navi_bootstrap.resolve.subprocess.run")
+    def test_first_failure_in_manifest_order_reported(
+        self, mock_run: MagicMock, action_shas_config: list[dict[str, str]]
+    ) -> None:
+        # The later entry fails first; the earlier one fails only after that
+        later_failed = threading.Event()
+
+        def fail(cmd: list[str], **_: object) -> MagicMock:
+            if "actions/checkout" in cmd[2]:
+                assert later_failed.wait(timeout=5)
+            else:
+                later_failed.set()
+            return MagicMock(returncode=1, stdout="", stderr="Not Found")
+
+        mock_run.side_effect = fail
+        with pytest.raises(ResolveError, match=r"actions/checkout@v4\.2\.2"):
+            resolve_action_shas(action_shas_config)
+
     def test_empty_list_returns_empty(self) -> None:
         shas, versions = resolve_action_shas([])
         assert shas == {}
@@ -3,12 +3,14 @@
 from __future__ import annotations
 
 import json
+import os
 from pathlib import Path
 from typing import Any
 
 import pytest
 
-from navi_bootstrap.spec import SpecError, load_spec, validate_spec
+from navi_bootstrap.sanitize import sanitize_spec
+from navi_bootstrap.spec import SpecError, _load_spec_cached, load_spec, validate_spec
 
 
 class TestValidateSpec:
@@ -81,3 +83,59 @@ class TestLoadSpec:
         spec_file.write_text(json.dumps({"language": "python"}))
         with pytest.raises(SpecError):
             load_spec(spec_file)
+
+    def test_repeated_load_is_cached(self, tmp_path: Path, minimal_spec: dict[str, Any]) -> None:
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(minimal_spec))
+        load_spec(spec_file)
+        before = _load_spec_cached.cache_info()
+        assert load_spec(spec_file) == minimal_spec
+        after = _load_spec_cached.cache_info()
+        assert (after.hits, after.misses) == (before.hits + 1, before.misses)
+
+    def test_mutating_sanitized_result_does_not_leak(
+        self, tmp_path: Path, minimal_spec: dict[str, Any]
+    ) -> None:
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(minimal_spec))
+        result = sanitize_spec(load_spec(spec_file))
+        result["features"]["ci"] = "MUTATED"
+        result["name"] = "other"
+        assert load_spec(spec_file) == minimal_spec
+
+    def test_modified_file_is_reloaded(self, tmp_path: Path, minimal_spec: dict[str, Any]) -> None:
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(minimal_spec))
+        assert load_spec(spec_file)["name"] == "test-project"
+
+        spec_file.write_text(json.dumps({**minimal_spec, "name": "renamed"}))
+        st = spec_file.stat()
+        os.utime(spec_file, ns=(st.st_atime_ns, st.st_mtime_ns + 1_000_000_000))
+        assert load_spec(spec_file)["name"] == "renamed"
+
+    def test_resized_file_with_same_mtime_is_reloaded(
+        self, tmp_path: Path, minimal_spec: dict[str, Any]
+    ) -> None:
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(minimal_spec))
+        mtime_ns = spec_file.stat().st_mtime_ns
+        assert load_spec(spec_file)["name"] == "test-project"
+
+        spec_file.write_text(json.dumps({**minimal_spec, "name": "renamed-longer"}))
+        os.utime(spec_file, ns=(mtime_ns, mtime_ns))
+        assert load_spec(spec_file)["name"] == "renamed-longer"
+
+    def test_replaced_file_with_same_size_and_mtime_is_reloaded(
+        self, tmp_path: Path, minimal_spec: dict[str, Any]
+    ) -> None:
+        spec_file = tmp_path / "spec.json"
+        spec_file.write_text(json.dumps(minimal_spec))
+        mtime_ns = spec_file.stat().st_mtime_ns
+        assert load_spec(spec_file)["name"] == "test-project"
+
+        # Same length name, written elsewhere and swapped in (new inode)
+        replacement = tmp_path / "replacement"
+        replacement.write_text(json.dumps({**minimal_spec, "name": "best-project"}))
+        os.utime(replacement, ns=(mtime_ns, mtime_ns))
+        os.replace(replacement, spec_file)
+        assert load_spec(spec_file)["name"] == "best-project"
@@ -5,6 +5,8 @@ from __future__ import annotations
 from pathlib import Path
 from unittest.mock import MagicMock, patch
 
+import pytest
+
 from navi_bootstrap.validate import run_validations
 
 
@@ -52,3 +54,68 @@ class TestRunValidations:
         assert len(results) == 1
         assert results[0].skipped
         mock_run.assert_not_called()
+
+    @patch("navi_bootstrap.validate.shutil.which", return_value="/usr/bin/uv")
+    @patch("navi_bootstrap.validate.subprocess.run")
+    def test_plain_command_runs_without_shell(
+        self, mock_run: MagicMock, _which: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        run_validations([{"description": "lock", "command": "uv lock"}], tmp_path)
+        args, kwargs = mock_run.call_args
+        assert args[0] == ["uv", "lock"]
+        assert kwargs["shell"] is False
+
+    @patch("navi_bootstrap.validate.shutil.which", return_value="/usr/bin/python")
+    @patch("navi_bootstrap.validate.subprocess.run")
+    def test_shell_syntax_runs_through_shell(
+        self, mock_run: MagicMock, _which: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=0, stdout="", stderr="")
+        command = "python -c \"import json; json.load(open('x.json'))\""
+        run_validations([{"description": "json", "command": command}], tmp_path)
+        args, kwargs = mock_run.call_args
+        assert args[0] == command
+        assert kwargs["shell"] is True
+
+    @patch("navi_bootstrap.validate.shutil.which", return_value=None)
+    @patch("navi_bootstrap.validate.subprocess.run")
+    def test_unknown_program_left_to_shell(
+        self, mock_run: MagicMock, _which: MagicMock, tmp_path: Path
+    ) -> None:
+        mock_run.return_value = MagicMock(returncode=127, stdout="", stderr="not found")
+        results = run_validations([{"description": "x", "command": "nosuchtool"}], tmp_path)
+        assert mock_run.call_args.kwargs["shell"] is True
+        assert not results[0].passed
+
+    def test_relative_program_resolved_in_working_dir(
+        self, tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """./script is looked up in working_dir, not in the process cwd."""
+        work = tmp_path / "work"
+        other = tmp_path / "other"
+        work.mkdir()
+        other.mkdir()
+        script = work / "check.sh"
+        script.write_text("#!/bin/sh\nexit 0\n")
+        script.chmod(0o755)
+
+        # Present only in working_dir: runs
+        monkeypatch.chdir(other)
+        results = run_validations([{"description": "x", "command": "./check.sh"}], work)
+        assert results[0].passed
+
+        # Present only in the process cwd: fails cleanly, does not raise
+        monkeypatch.chdir(work)
+        results = run_validations([{"description": "x", "command": "./check.sh"}], other)
+        assert not results[0].passed
+        assert results[0].returncode == 127
+
+    @patch("navi_bootstrap.validate.shutil.which", return_value="/usr/bin/uv")
+    @patch("navi_bootstrap.validate.subprocess.run", side_effect=FileNotFoundError("uv"))
+    def test_argv_os_error_recorded_as_failure(
+        self, _run: MagicMock, _which: MagicMock, tmp_path: Path
+    ) -> None:
+        results = run_validations([{"description": "lock", "command": "uv lock"}], tmp_path)
+        assert not results[0].passed
+        assert results[0].returncode == 127